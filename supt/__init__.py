@@ -0,0 +1,3 @@
+from supt.app import render
+
+__all__ = ["render"]
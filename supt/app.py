@@ -0,0 +1,103 @@
+# ===============================================================
+# SUPT :: SunWolf ReSunance Continuum — Live Diagnostic Dashboard
+# ===============================================================
+# Entry-point scripts are re-executed on every Streamlit rerun; keeping the
+# feeds, metrics and figure builders in this package means their imports,
+# HTTP session and precomputed tables are set up once per process.
+
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from supt.io import fetch_noaa_kp, load_seismic_data
+from supt.metrics import (
+    classify_phase,
+    compute_cci,
+    compute_eii,
+    generate_forecast_wave,
+    seismic_signature,
+    shallow_ratio_of,
+    supt_diagnostic,
+)
+from supt.plots import build_cci_gauge, build_forecast_figure, session_figure
+
+REFRESH_INTERVAL = 60  # seconds
+
+def render(version="6.6"):
+    st.set_page_config(
+        page_title="SunWolf ReSunance Continuum — SUPT Live Monitor",
+        layout="wide",
+        page_icon="☀️"
+    )
+
+    st.title("☀️ SunWolf ReSunance Continuum — SUPT Live Monitor")
+    st.caption(f"Real-Time ψₛ–Depth–Kp Continuum | Campi Flegrei • SUPT v{version}")
+
+    st.sidebar.header("Live Parameters")
+    psi_s = st.sidebar.slider("Solar Pressure Proxy (ψₛ)", 0.0, 1.0, 0.72, 0.01)
+    st.sidebar.write(f"Auto-refresh every {REFRESH_INTERVAL} seconds.")
+    refresh = st.sidebar.button("🔁 Refresh Data")
+
+    # Load data — local CSV parse overlaps the NOAA round-trip
+    with st.spinner("Loading NOAA and INGV feeds…"):
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_seismic = ex.submit(load_seismic_data)
+            f_kp = ex.submit(fetch_noaa_kp)
+            (df, seismic_msg), (kp_index, kp_msg) = f_seismic.result(), f_kp.result()
+    for msg in (seismic_msg, kp_msg):
+        if msg:
+            st.warning(msg)
+
+    # Compute metrics
+    if df.empty:
+        st.warning("INGV fetch failed (auto-handled): Empty INGV dataset.")
+        md_max, md_mean, shallow_ratio = 0, 0, 0
+    else:
+        md_max = df['magnitude'].max()
+        md_mean = df['magnitude'].mean()
+        shallow_ratio = shallow_ratio_of(df)
+
+    EII = compute_eii(md_max, md_mean, shallow_ratio, psi_s)
+    RPAM = classify_phase(EII)
+
+    # Display metrics
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Energetic Instability Index (EII)", f"{EII:.3f}")
+    col2.metric("RPAM Status", RPAM)
+    col3.metric("Kp Index", f"{kp_index:.1f}")
+
+    # ======================
+    # ψₛ–Depth Coherence Index
+    # ======================
+    st.markdown("### 🌀 ψₛ–Depth Coherence Index (CCI)")
+    cci = compute_cci(psi_s, seismic_signature(df), df["depth_km"].to_numpy()) if not df.empty else 0.0
+
+    color = "green" if cci >= 0.7 else "orange" if cci >= 0.4 else "red"
+    label = "Coherent" if cci >= 0.7 else "Moderate" if cci >= 0.4 else "Decoupled"
+
+    gauge = session_figure("cci_gauge", build_cci_gauge)
+    indicator = gauge.data[0]
+    indicator.value = cci
+    indicator.title.text = f"CCI: {label}"
+    indicator.gauge.bar.color = color
+    st.plotly_chart(gauge, use_container_width=True)
+
+    # ======================
+    # LIVE DIAGNOSTIC PANEL
+    # ======================
+    st.markdown(supt_diagnostic(EII, cci, kp_index))
+
+    # ======================
+    # ψₛ 48-HOUR FORECAST
+    # ======================
+    st.markdown("### 🔮 48-Hour ψₛ Resonance Forecast")
+    forecast = generate_forecast_wave(psi_s)
+    fig = session_figure("forecast_fig", build_forecast_figure)
+    fig.data[0].x = forecast["hour"]
+    fig.data[0].y = forecast["forecast_psi"]
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Footer
+    st.caption(f"Updated {dt.datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')} | Feeds: NOAA • INGV | Mode: Continuum Live v{version}")
+    st.caption("Powered by Sheppard’s Universal Proxy Theory — ψₛ–Depth–Kp Harmonic Continuity Engine.")
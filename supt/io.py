@@ -0,0 +1,120 @@
+# ===============================================================
+# SUPT :: Data feeds — NOAA Kp index and local INGV event catalogue
+# ===============================================================
+
+import os
+import time
+
+import orjson
+import pandas as pd
+import pyarrow.parquet as pq
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LOCAL_DATA = "events.csv"
+LOCAL_PARQUET = "events.parquet"  # columnar cache of LOCAL_DATA, rebuilt when stale
+# Accepted source headers for each working column, in order of preference
+EVENT_COLUMN_ALIASES = {
+    "time": ("Time", "time"),
+    "magnitude": ("MD", "Magnitude", "md", "mag"),
+    "depth_km": ("Depth", "Depth/Km", "depth"),
+}
+NOAA_KP_URL = "https://services.swpc.noaa.gov/products/noaa-planetary-k-index.json"
+HTTP_TIMEOUT = (3, 7)  # (connect, read) seconds
+KP_FAILURE_BACKOFF = 60  # seconds to serve the fallback after a failed fetch
+
+# Shared keep-alive session so repeat feed calls reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+))
+
+# Cached loaders raise on failure so errors are never memoized; the public
+# wrappers turn them into (value, status_msg) for the caller to render.
+# show_spinner is off because the app calls these from worker threads,
+# which have no ScriptRunContext; the app draws one spinner instead.
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_noaa_kp():
+    r = _SESSION.get(NOAA_KP_URL, timeout=HTTP_TIMEOUT)
+    r.raise_for_status()
+    data = orjson.loads(r.content)
+    latest = data[-1]
+    return float(latest[1])
+
+# Short negative cache: after a failure, reruns serve the fallback for
+# KP_FAILURE_BACKOFF seconds instead of re-paying the timeouts and retries.
+_KP_FAILURE = {"at": None, "msg": None}
+
+def fetch_noaa_kp():
+    failed_at = _KP_FAILURE["at"]
+    if failed_at is not None and time.monotonic() - failed_at < KP_FAILURE_BACKOFF:
+        return 0.0, _KP_FAILURE["msg"]
+    try:
+        kp = _fetch_noaa_kp()
+    except Exception as e:
+        _KP_FAILURE["at"], _KP_FAILURE["msg"] = time.monotonic(), f"NOAA Kp fetch failed: {e}"
+        return 0.0, _KP_FAILURE["msg"]
+    _KP_FAILURE["at"] = None
+    return kp, None
+
+def resolve_event_columns(columns):
+    # Map the first matching source header for each working column onto it
+    mapping = {}
+    for target, aliases in EVENT_COLUMN_ALIASES.items():
+        source = next((c for c in aliases if c in columns), None)
+        if source is not None:
+            mapping[source] = target
+    return mapping
+
+def read_event_csv(mapping):
+    df = pd.read_csv(LOCAL_DATA, engine="pyarrow", usecols=list(mapping))
+    return df.rename(columns=mapping)
+
+def parquet_is_current(columns):
+    # Stale if older than the CSV or written with a different column layout
+    if (not os.path.exists(LOCAL_PARQUET)
+            or os.path.getmtime(LOCAL_PARQUET) < os.path.getmtime(LOCAL_DATA)):
+        return False
+    try:
+        return sorted(pq.read_schema(LOCAL_PARQUET).names) == columns
+    except (OSError, ValueError):
+        return False
+
+def read_local_events():
+    mapping = resolve_event_columns(pd.read_csv(LOCAL_DATA, nrows=0).columns)
+    columns = sorted(mapping.values())
+    try:
+        if not parquet_is_current(columns):
+            read_event_csv(mapping).to_parquet(LOCAL_PARQUET, compression="snappy", index=False)
+        return pd.read_parquet(LOCAL_PARQUET, columns=columns)
+    except OSError:
+        # Read-only deployments can't write the Parquet copy; parse the CSV directly
+        return read_event_csv(mapping)
+
+# Disk-persisted caches ignore TTL, so the entry is keyed on the CSV mtime
+# instead: editing events.csv invalidates it, restarts reuse it.
+@st.cache_data(persist="disk", max_entries=8, show_spinner=False)
+def _load_seismic_data(data_mtime):
+    df = read_local_events()
+    missing = [c for c in EVENT_COLUMN_ALIASES if c not in df.columns]
+    if missing:
+        raise ValueError(f"no {', '.join(missing)} column in {LOCAL_DATA}")
+    if pd.api.types.is_datetime64_any_dtype(df['time']):
+        # pyarrow already parsed the timestamps; only attach the UTC zone
+        df['time'] = pd.to_datetime(df['time'], utc=True)
+    else:
+        # INGV times are ISO 8601 with a space separator and variable fractional seconds
+        df['time'] = pd.to_datetime(df['time'], format='ISO8601', errors='coerce', utc=True, cache=True)
+    df['magnitude'] = pd.to_numeric(df['magnitude'], errors='coerce', downcast='float')
+    df['depth_km'] = pd.to_numeric(df['depth_km'], errors='coerce', downcast='float')
+    return df.dropna(subset=['time', 'magnitude', 'depth_km'])
+
+def load_seismic_data():
+    try:
+        return _load_seismic_data(os.path.getmtime(LOCAL_DATA)), None
+    except Exception as e:
+        return pd.DataFrame(), f"Local data load failed: {e}"
@@ -0,0 +1,38 @@
+# ===============================================================
+# SUPT :: Figures — CCI gauge and 48h ψₛ forecast
+# ===============================================================
+
+import plotly.graph_objects as go
+import streamlit as st
+
+# Figures are built once per session and only their data is updated on
+# rerun; Plotly's layout validation dominates the cost of these charts.
+def session_figure(key, build):
+    if key not in st.session_state:
+        st.session_state[key] = build()
+    return st.session_state[key]
+
+def build_cci_gauge():
+    return go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=0,
+        gauge={
+            "axis": {"range": [0, 1]},
+            "steps": [
+                {"range": [0, 0.4], "color": "#FFCDD2"},
+                {"range": [0.4, 0.7], "color": "#FFF59D"},
+                {"range": [0.7, 1.0], "color": "#C8E6C9"},
+            ],
+        },
+    ))
+
+def build_forecast_figure():
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        mode="lines", line=dict(color="#FFB300", width=3),
+        name="ψₛ Forecast"))
+    fig.update_layout(
+        title="SUPT ψₛ Harmonic Projection (48h)",
+        xaxis_title="Hours Ahead", yaxis_title="ψₛ Index",
+        template="plotly_white")
+    return fig